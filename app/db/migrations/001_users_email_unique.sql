@@ -0,0 +1,25 @@
+-- Unique index on users(email).
+-- login, forgot-password and get_user_by_email look users up by email, and signup /
+-- update-profile rely on ER_DUP_ENTRY from this key to report "email already taken".
+-- InnoDB secondary indexes carry the primary key, so lookups by email are one index
+-- seek plus one clustered-key read. Safe to run more than once.
+
+SET @idx_exists := (
+    SELECT COUNT(*)
+    FROM information_schema.statistics
+    WHERE table_schema = DATABASE()
+      AND table_name = 'users'
+      AND column_name = 'email'
+      AND seq_in_index = 1
+      AND non_unique = 0
+);
+
+SET @ddl := IF(
+    @idx_exists = 0,
+    'CREATE UNIQUE INDEX idx_users_email ON users (email)',
+    'SELECT 1'
+);
+
+PREPARE stmt FROM @ddl;
+EXECUTE stmt;
+DEALLOCATE PREPARE stmt;
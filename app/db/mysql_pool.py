@@ -1,4 +1,6 @@
 from mysql.connector import pooling
+from contextlib import contextmanager
+import threading
 import os
 
 # --- Database pooling setup  ---
@@ -11,19 +13,46 @@ DB_CONFIG = {
     "autocommit": True,
 }
 
+# mysql.connector caps a pool at 32 connections
+DB_POOL_SIZE = min(32, int(os.getenv("DB_POOL_SIZE", "16")))
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "10"))
+
 # --- .env Validation check ---
 
 for k in ("host","user","password","database"):
     if not DB_CONFIG.get(k):
         raise RuntimeError(f"Missing env var {k}")
 
-pool = pooling.MySQLConnectionPool(pool_name="authpool", pool_size=5, **DB_CONFIG)
+# Connections run in autocommit and no route sets session variables, so there is nothing
+# for COM_RESET_CONNECTION to clean up; skipping it saves a round trip on every checkin.
+pool = pooling.MySQLConnectionPool(
+    pool_name="authpool",
+    pool_size=DB_POOL_SIZE,
+    pool_reset_session=False,
+    **DB_CONFIG,
+)
+
+# MySQLConnectionPool raises PoolError as soon as it is exhausted; gate checkouts
+# so request threads wait for a free connection instead of failing under load.
+_pool_slots = threading.BoundedSemaphore(DB_POOL_SIZE)
 
 # --- DB Connection Dependency ---
 
-def get_db():
-    conn = pool.get_connection()
+@contextmanager
+def db_connection():
+    """Check a connection out of the pool; for code that only sometimes needs the DB."""
+    if not _pool_slots.acquire(timeout=DB_POOL_TIMEOUT):
+        raise RuntimeError("Timed out waiting for a database connection")
     try:
-        yield conn
+        conn = pool.get_connection()
+        try:
+            yield conn
+        finally:
+            conn.close()
     finally:
-        conn.close()
\ No newline at end of file
+        _pool_slots.release()
+
+
+def get_db():
+    with db_connection() as conn:
+        yield conn
@@ -1,20 +1,41 @@
-from fastapi import FastAPI
+import os
+import orjson
+import anyio.to_thread
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, Response
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from dotenv import load_dotenv
 
+from app.utils.cors import WildcardCORSMiddleware
+
 load_dotenv()
 
 from app.routes import trip_optimizer, cluster, multicluster, gemini, auth, trips_crud
 
 # --- FastAPI main app code---
 
-app = FastAPI(title="IM3180 API", version="1.2")
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],  # tighten to your frontend domain in prod
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+CORS_ALLOW_ORIGINS = ["*"]  # tighten to your frontend domain in prod
+# Sync routes (DB, Google, S3) run on AnyIO's worker threads; its default cap of 40 queues requests under load
+THREADPOOL_SIZE = int(os.getenv("THREADPOOL_SIZE", "64"))
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    anyio.to_thread.current_default_thread_limiter().total_tokens = THREADPOOL_SIZE
+    yield
+
+
+app = FastAPI(title="IM3180 API", version="1.2", default_response_class=ORJSONResponse, lifespan=lifespan)
+if CORS_ALLOW_ORIGINS == ["*"]:
+    app.add_middleware(WildcardCORSMiddleware)
+else:
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=CORS_ALLOW_ORIGINS,
+        allow_methods=["*"],
+        allow_headers=["*"],
+    )
 
 app.include_router(trip_optimizer.router)
 app.include_router(cluster.router)
@@ -23,6 +44,40 @@ app.include_router(gemini.router)
 app.include_router(auth.router)
 app.include_router(trips_crud.router)
 
+# Fixed payload, so the whole response is built once and returned as-is on every call
+_ROOT_RESPONSE = Response(
+    orjson.dumps({"success": True, "project": "IM3180-IE04-AY2526"}),
+    media_type="application/json",
+)
+
+
 @app.get("/")
-def test():
-    return {"success": True,"project": "IM3180-IE04-AY2526"}
+async def test():
+    return _ROOT_RESPONSE
+
+
+# Pydantic already compiles the request/response validators when the models are defined;
+# the OpenAPI schema is the one piece built lazily, so build and serialize it once here.
+# The default /openapi.json route re-encodes the schema on every hit, so swap it for the cached bytes.
+_OPENAPI_JSON = orjson.dumps(app.openapi())
+app.router.routes = [route for route in app.router.routes if getattr(route, "path", None) != app.openapi_url]
+
+
+@app.get(app.openapi_url, include_in_schema=False)
+async def openapi_json():
+    return Response(_OPENAPI_JSON, media_type="application/json")
+
+
+# --- Production launch: python -m app.main ---
+# Same as the uvicorn command in the README; WEB_CONCURRENCY overrides the worker count.
+if __name__ == "__main__":
+    import uvicorn
+
+    uvicorn.run(
+        "app.main:app",
+        host="0.0.0.0",
+        port=int(os.getenv("PORT", "8000")),
+        loop="uvloop",
+        http="httptools",
+        workers=int(os.getenv("WEB_CONCURRENCY", str(os.cpu_count() or 1))),
+    )
@@ -0,0 +1,123 @@
+# --- OpenAPI Examples ---
+# --- Shared example payloads for the documentation page ---
+
+CLUSTER_IN_EXAMPLE = {
+    "locations_sorted": [
+        {"latitude": 1.290270, "longitude": 103.851959, "priority": 1, "stay_hours": 2},
+        {"place_id": "ChIJd7zN_thp2jERcf0cKlU5n9A", "priority": 2, "stay_hours": 3},
+        {"latitude": 1.283333, "longitude": 103.833333, "priority": 3, "stay_hours": 4},
+    ],
+    "requested_days": 2,
+    "max_hours_per_day": 8
+}
+
+CLUSTER_OUT_EXAMPLE = {
+    "user_preference_solution": {
+        "days": [
+            {
+                "day": 1,
+                "locations": [
+                    {
+                        "latitude": 1.290270,
+                        "longitude": 103.851959,
+                        "priority": 1,
+                        "stay_hours": 2,
+                        "cluster_id": 0,
+                        "place_id": "ChIJd7zN_thp2jERcf0cKlU5n9A"
+                    }
+                ],
+            }
+        ],
+        "rejected": []
+    },
+    "optimal_solution": {
+        "days": [
+            {
+                "day": 1,
+                "locations": [
+                    {
+                        "latitude": 1.352083,
+                        "longitude": 103.819836,
+                        "priority": 2,
+                        "stay_hours": 3,
+                        "cluster_id": 1,
+                        "place_id": "ChIJ..."
+                    }
+                ]
+            }
+        ]
+    }
+}
+
+TRIP_OPTI_IN_EXAMPLE = {
+    "addresses": [
+        "placeID-hotel",
+        "placeID-1",
+        "placeID-lunch",
+        "placeID-3",
+        "placeID-dinner",
+    ],
+    "hotel_index": 0,
+    "service_times": [0, 20, 60, 60, 60]
+}
+
+TRIP_OPTI_OUT_EXAMPLE = {
+    "route": [
+        {
+            "route_index": 0,
+            "place_id": "ChIJYakjWbYZ2jERgSiDZRBS8OY",
+            "arrival_time": "09:00",
+            "service_time": 0,
+            "type": "Start"
+        },
+        {
+            "route_index": 1,
+            "place_id": "ChIJzVHFNqkZ2jERboLN2YrltH8",
+            "arrival_time": "09:59",
+            "service_time": 30,
+            "type": "Attraction"
+        },
+        {
+            "route_index": 2,
+            "place_id": "ChIJC00vnUgZ2jERodPEc17Iv3Q",
+            "arrival_time": "12:10",
+            "service_time": 120,
+            "type": "Lunch"
+        },
+        {
+            "route_index": 3,
+            "place_id": "ChIJWT0bvgsZ2jERM7sHz6m87gE",
+            "arrival_time": "13:30",
+            "service_time": 60,
+            "type": "Attraction"
+        },
+        {
+            "route_index": 4,
+            "place_id": "ChIJRYMSeKwe2jERAR2QXVU39vg",
+            "arrival_time": "16:29",
+            "service_time": 120,
+            "type": "Attraction"
+        },
+        {
+            "route_index": 5,
+            "place_id": "ChIJgftoQGYZ2jERYN5VifWB6Ms",
+            "arrival_time": "17:48",
+            "service_time": 30,
+            "type": "Dinner"
+        },
+        {
+            "route_index": 6,
+            "place_id": "ChIJ42h1onIZ2jERBbs-VGqmwrs",
+            "arrival_time": "19:49",
+            "service_time": 120,
+            "type": "Attraction"
+        },
+        {
+            "route_index": 7,
+            "place_id": "ChIJYakjWbYZ2jERgSiDZRBS8OY",
+            "arrival_time": "20:35",
+            "service_time": 0,
+            "type": "End"
+        }
+    ]
+}
@@ -1,17 +1,29 @@
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, EmailStr, field_validator
 from typing import Optional
+import re
 
 # --- Authentication Models ---
 
+# Login only needs to reject obviously malformed input before the DB lookup;
+# full EmailStr validation is kept for signup where the address gets stored.
+_LOGIN_EMAIL_RE = re.compile(r"^[^@\s]{1,64}@[^@\s]{1,255}$")
+
 class SignupIn(BaseModel):
     email: EmailStr
     password: str
     name: Optional[str] = ""
 
 class LoginIn(BaseModel):
-    email: EmailStr
+    email: str
     password: str
 
+    @field_validator("email")
+    @classmethod
+    def validate_email(cls, value: str) -> str:
+        if not _LOGIN_EMAIL_RE.match(value):
+            raise ValueError("value is not a valid email address")
+        return value
+
 class TokenOut(BaseModel):
     access_token: str
     token_type: str = "bearer"
@@ -1,6 +1,8 @@
-from pydantic import BaseModel, Field, model_validator
+from pydantic import BaseModel, Field
 from typing import Optional, List
 
+from app.models._examples import CLUSTER_IN_EXAMPLE, CLUSTER_OUT_EXAMPLE
+
 
 # ----------------------------
 # Input Models
@@ -18,15 +20,7 @@ class LocationIn(BaseModel):
     )
     priority: int = Field(..., description="Priority score of this location")
     stay_hours: float = Field(..., description="Planned stay duration at this location (hours)")
-
-    @model_validator(mode="after")
-    def check_coordinates_or_placeid(self):
-        """Ensure at least one of (place_id) OR (latitude+longitude) is provided."""
-        if not self.place_id and (self.latitude is None or self.longitude is None):
-            raise ValueError(
-                "Each location must provide either place_id or both latitude and longitude"
-            )
-        return self
+    # place_id OR latitude+longitude is enforced by the cluster route's preprocessing pass
 
 
 class ClusterIn(BaseModel):
@@ -34,19 +28,7 @@ class ClusterIn(BaseModel):
     requested_days: Optional[int] = Field(3, description="Number of days requested for trip")
     max_hours_per_day: Optional[int] = Field(12, description="Maximum hours available per day")
 
-    model_config = {
-        "json_schema_extra": {
-            "example": {
-                "locations_sorted": [
-                    {"latitude": 1.290270, "longitude": 103.851959, "priority": 1, "stay_hours": 2},
-                    {"place_id": "ChIJd7zN_thp2jERcf0cKlU5n9A", "priority": 2, "stay_hours": 3},
-                    {"latitude": 1.283333, "longitude": 103.833333, "priority": 3, "stay_hours": 4},
-                ],
-                "requested_days": 2,
-                "max_hours_per_day": 8
-            }
-        }
-    }
+    model_config = {"json_schema_extra": {"example": CLUSTER_IN_EXAMPLE}}
 
 
 # ----------------------------
@@ -80,44 +62,4 @@ class ClusterOut(BaseModel):
     user_preference_solution: UserPreferenceSolutionOut
     optimal_solution: OptimalSolutionOut
 
-    model_config = {
-        "json_schema_extra": {
-            "example": {
-                "user_preference_solution": {
-                    "days": [
-                        {
-                            "day": 1,
-                            "locations": [
-                                {
-                                    "latitude": 1.290270,
-                                    "longitude": 103.851959,
-                                    "priority": 1,
-                                    "stay_hours": 2,
-                                    "cluster_id": 0,
-                                    "place_id": "ChIJd7zN_thp2jERcf0cKlU5n9A"
-                                }
-                            ],
-                        }
-                    ],
-                    "rejected": []
-                },
-                "optimal_solution": {
-                    "days": [
-                        {
-                            "day": 1,
-                            "locations": [
-                                {
-                                    "latitude": 1.352083,
-                                    "longitude": 103.819836,
-                                    "priority": 2,
-                                    "stay_hours": 3,
-                                    "cluster_id": 1,
-                                    "place_id": "ChIJ..."
-                                }
-                            ]
-                        }
-                    ]
-                }
-            }
-        }
-    }
+    model_config = {"json_schema_extra": {"example": CLUSTER_OUT_EXAMPLE}}
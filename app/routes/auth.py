@@ -1,18 +1,33 @@
 import os
+import re
 import jwt
-import bcrypt
+import uuid
+import hmac
+import time
+import base64
+import hashlib
 import logging
+import binascii
+import threading
+import orjson
 import mysql.connector
-from datetime import datetime, timedelta, timezone
-from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from fastapi import APIRouter, Depends, HTTPException
+from mysql.connector import errorcode
+from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from fastapi.security import HTTPBearer
+from fastapi import APIRouter, Depends, HTTPException, Request
+from starlette.concurrency import run_in_threadpool
+from cachetools import TTLCache
 
 from app.models.auth_models import SignupIn, LoginIn, MeOut, TokenOut
 from app.models.error_models import HTTPError
-from app.db.mysql_pool import get_db
+from app.db.mysql_pool import get_db, db_connection
+from app.utils.password_hash import hash_password, hash_password_async, verify_password_async
 
 from fastapi import UploadFile, File, Form
 import boto3
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config as BotoConfig
 from botocore.exceptions import BotoCoreError, ClientError
 
 from pydantic import BaseModel
@@ -37,9 +52,41 @@ class ResetPasswordIn(BaseModel):
     new_password: str
 
 
+@dataclass(frozen=True, slots=True)
+class CurrentUser:
+    id: int
+    email: str
+    name: str
+    profile_picture_url: str | None
+
+
 S3_BUCKET = os.getenv("AWS_S3_BUCKET_NAME", "trip-opt-bucket2")
 S3_REGION = os.getenv("AWS_REGION", "ap-southeast-2")
-s3_client = boto3.client("s3", region_name=S3_REGION)
+# One client per process; its pool is sized for the worker threadpool so concurrent
+# uploads reuse open TLS connections instead of queueing on botocore's default of 10.
+s3_client = boto3.client(
+    "s3",
+    region_name=S3_REGION,
+    config=BotoConfig(
+        max_pool_connections=64,
+        retries={"max_attempts": 3, "mode": "adaptive"},
+        tcp_keepalive=True,
+        connect_timeout=5,
+        read_timeout=30,
+    ),
+)
+# Stored profile picture URLs point at a CDN in front of the bucket when one is configured
+# (e.g. a CloudFront domain), so image fetches are served from the edge instead of S3
+S3_PUBLIC_URL = os.getenv("AWS_S3_PUBLIC_URL", "")
+_S3_URL_PREFIX = (S3_PUBLIC_URL.rstrip("/") or f"https://{S3_BUCKET}.s3.{S3_REGION}.amazonaws.com") + "/"
+_UNSAFE_KEY_CHARS_RE = re.compile(r"[^A-Za-z0-9._-]")
+# Uploads above 5 MB go up as 5 MB parts over 4 concurrent connections
+_S3_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=5 * 1024 * 1024,
+    multipart_chunksize=5 * 1024 * 1024,
+    max_concurrency=4,
+    use_threads=True,
+)
 
 # --- Setup global constants ---
 
@@ -48,8 +95,30 @@ logger = logging.getLogger("auth")
 JWT_ALG = "HS256"
 SECRET_KEY = os.getenv("SECRET_KEY", "change-me")
 JWT_EXPIRE_MINUTES = int(os.getenv("JWT_EXPIRE_MINUTES", "60"))
+JWT_EXPIRE_SECONDS = JWT_EXPIRE_MINUTES * 60
+RESET_TOKEN_EXPIRE_SECONDS = 15 * 60
+
+# Hashed once per process at BCRYPT_COST; login verifies against it when the email is unknown
+_DUMMY_PASSWORD_HASH = hash_password(uuid.uuid4().hex)
+
+# HS256 tokens are signed/verified directly with hmac + sha256 (PyJWT is only
+# used for its exception types), so the header and key are prepared once here.
+_SECRET_BYTES = SECRET_KEY.encode("utf-8")
+# Keyed once; copying it per token skips re-deriving the HMAC inner/outer pads
+_HMAC_SHA256 = hmac.new(_SECRET_BYTES, digestmod=hashlib.sha256)
+_JWT_HEADER_B64 = base64.urlsafe_b64encode(b'{"alg":"HS256","typ":"JWT"}').rstrip(b"=")
+
+class BearerToken(HTTPBearer):
+    """HTTPBearer for the OpenAPI scheme, but returns the raw token string straight from the header."""
+
+    async def __call__(self, request: Request) -> str:
+        header = request.headers.get("authorization")
+        if not header or header[:7].lower() != "bearer ":
+            raise HTTPException(401, "Not authenticated", headers={"WWW-Authenticate": "Bearer"})
+        return header[7:]
 
-security = HTTPBearer()
+
+security = BearerToken(scheme_name="HTTPBearer")
 # --- Function for Email Sending ---
 
 # --- Email Setup ---
@@ -58,13 +127,58 @@ EMAIL_PASSWORD = os.getenv("EMAIL_PASSWORD", "")
 EMAIL_SMTP_SERVER = os.getenv("EMAIL_SMTP_SERVER", "smtp.gmail.com")
 EMAIL_SMTP_PORT = int(os.getenv("EMAIL_SMTP_PORT", "465"))
 
+# Reset emails go out on their own small pool, so queued sends never hold request threads.
+# Each worker keeps one logged-in SMTP session and checks it with NOOP before reusing it.
+EMAIL_SEND_WORKERS = int(os.getenv("EMAIL_SEND_WORKERS", "2"))
+_EMAIL_POOL = ThreadPoolExecutor(max_workers=EMAIL_SEND_WORKERS, thread_name_prefix="smtp")
+_smtp_local = threading.local()
+
+
+def _drop_smtp_session() -> None:
+    server = getattr(_smtp_local, "server", None)
+    _smtp_local.server = None
+    if server is not None:
+        try:
+            server.close()
+        except Exception:
+            pass
+
+
+def _smtp_session() -> smtplib.SMTP_SSL:
+    """This worker's SMTP session, reconnecting if it was never opened or no longer answers NOOP."""
+    server = getattr(_smtp_local, "server", None)
+    if server is not None:
+        try:
+            if server.noop()[0] == 250:
+                return server
+        except (smtplib.SMTPException, OSError):
+            pass
+        _drop_smtp_session()
+
+    server = smtplib.SMTP_SSL(EMAIL_SMTP_SERVER, EMAIL_SMTP_PORT, timeout=30)
+    try:
+        server.login(EMAIL_SENDER, EMAIL_PASSWORD)
+    except Exception:
+        server.close()
+        raise
+    _smtp_local.server = server
+    return server
 
-def send_reset_email(to_email: str, reset_link: str):
-    """Send a password reset email using Gmail SMTP."""
-    if not EMAIL_SENDER or not EMAIL_PASSWORD:
-        logger.error("Email credentials not configured properly.")
-        raise HTTPException(500, "Email sending is not configured.")
 
+def _smtp_send(msg) -> None:
+    """Send over this worker's session; on any SMTP or socket error, retry once on a fresh one."""
+    for attempt in range(2):
+        try:
+            _smtp_session().send_message(msg)
+            return
+        except (smtplib.SMTPException, OSError):
+            _drop_smtp_session()
+            if attempt:
+                raise
+
+
+def send_reset_email(to_email: str, reset_link: str):
+    """Send a password reset email using Gmail SMTP. Runs on _EMAIL_POOL, so failures are only logged."""
     subject = "Trip Planner - Password Reset Request"
     text_body = f"""
     You requested to reset your password.
@@ -95,14 +209,79 @@ def send_reset_email(to_email: str, reset_link: str):
         msg.attach(MIMEText(text_body, "plain"))
         msg.attach(MIMEText(html_body, "html"))
 
-        with smtplib.SMTP_SSL(EMAIL_SMTP_SERVER, EMAIL_SMTP_PORT) as server:
-            server.login(EMAIL_SENDER, EMAIL_PASSWORD)
-            server.send_message(msg)
+        _smtp_send(msg)
 
         logger.info(f"Password reset email sent to {to_email}")
     except Exception as e:
         logger.error(f"Failed to send email to {to_email}: {e}")
-        raise HTTPException(500, "Failed to send reset email")
+
+
+# --- Token Dependency ---
+
+# Verified (uid, exp) pairs keyed by sha256(token); clients re-send the same bearer token on every call.
+# Entries live at most 30s and are re-checked against exp on every hit. Failures are never cached.
+_TOKEN_CACHE: TTLCache = TTLCache(maxsize=10000, ttl=30)
+_TOKEN_CACHE_LOCK = threading.Lock()
+
+
+def _decode_cached(token: str) -> int:
+    key = hashlib.sha256(token.encode("utf-8")).digest()
+    with _TOKEN_CACHE_LOCK:
+        entry = _TOKEN_CACHE.get(key)
+    if entry is not None and entry[1] > time.time():
+        return entry[0]
+    payload = decode_token(token)
+    # Convert sub once per token rather than on every request
+    uid = int(payload["sub"])
+    with _TOKEN_CACHE_LOCK:
+        _TOKEN_CACHE[key] = (uid, payload.get("exp", float("inf")))
+    return uid
+
+
+async def get_uid_from_token(token: str = Depends(security)) -> int:
+    """Resolve the bearer token to a user id, or 401. async so it runs inline, not in the threadpool."""
+    try:
+        return _decode_cached(token)
+    except Exception:
+        raise HTTPException(401, "Invalid or expired token")
+
+
+# Profile rows keyed by user id so /me, /profile and /profile-picture skip the DB on repeat calls.
+# Profile updates drop the entry in this worker; the short TTL bounds staleness in the others.
+_USER_CACHE: TTLCache = TTLCache(maxsize=5000, ttl=10)
+_USER_CACHE_LOCK = threading.Lock()
+
+
+# Column order matches CurrentUser's fields
+_USER_BY_ID_SQL = "SELECT id, email, name, profile_picture_url FROM users WHERE id=%s"
+
+
+def current_user(uid: int = Depends(get_uid_from_token)) -> CurrentUser:
+    """Load the token's user (404 if gone); only checks out a DB connection on a cache miss."""
+    with _USER_CACHE_LOCK:
+        user = _USER_CACHE.get(uid)
+    if user is not None:
+        return user
+
+    with db_connection() as conn:
+        cur = conn.cursor()
+        try:
+            cur.execute(_USER_BY_ID_SQL, (uid,))
+            row = cur.fetchone()
+        finally:
+            cur.close()
+    if not row:
+        raise HTTPException(404, "User not found")
+
+    user = CurrentUser(*row)
+    with _USER_CACHE_LOCK:
+        _USER_CACHE[uid] = user
+    return user
+
+
+def _invalidate_user(uid: int) -> None:
+    with _USER_CACHE_LOCK:
+        _USER_CACHE.pop(uid, None)
 
 
 # --- Auth Routes ---
@@ -115,25 +294,27 @@ router = APIRouter(prefix="/auth", tags=["auth"])
     400: {"model": HTTPError, "description": "Password < 8 characters"},
     409: {"model": HTTPError, "description": "Email already registered"}
 })
-def signup(body: SignupIn, conn=Depends(get_db)):
+async def signup(body: SignupIn, conn=Depends(get_db)):
     if len(body.password) < 8:
         raise HTTPException(400, "Password must be at least 8 characters")
-    existing = get_user_by_email(conn, body.email)
-    if existing:
-        raise HTTPException(409, "Email already registered")
-    user_id = create_user(conn, body.email, body.name or "", body.password)
+    # No pre-check: the unique key on users.email reports duplicates in the same round trip as the insert
+    password_hash = await hash_password_async(body.password)
+    user_id = await run_in_threadpool(create_user, conn, body.email, body.name or "", password_hash)
     if not user_id:
         raise HTTPException(409, "Email already registered")
-    return MeOut(id=user_id, email=body.email, name=body.name or "")
+    return MeOut.model_construct(id=user_id, email=body.email, name=body.name or "")
 
 
 @router.post("/login", responses={
     200: {"model": TokenOut, "description": "Successful Response"},
     401: {"model": HTTPError, "description": "Invalid email or password"}
 })
-def login(body: LoginIn, conn=Depends(get_db)):
-    row = get_user_by_email(conn, body.email)
-    if not row or not verify_password(body.password, row["password_hash"]):
+async def login(body: LoginIn, conn=Depends(get_db)):
+    row = await run_in_threadpool(get_user_by_email, conn, body.email)
+    # Unknown emails are checked against a dummy hash of the same cost, so response
+    # time doesn't reveal which accounts exist
+    password_ok = await verify_password_async(body.password, row["password_hash"] if row else _DUMMY_PASSWORD_HASH)
+    if row is None or not password_ok:
         logger.warning("Failed login attempt for email=%s", body.email)
         raise HTTPException(401, "Invalid email or password")
     return create_token(row["id"], row["email"])
@@ -144,20 +325,9 @@ def login(body: LoginIn, conn=Depends(get_db)):
     401: {"model": HTTPError, "description": "Invalid or expired token"},
     404: {"model": HTTPError, "description": "User not found"}
 })
-def me(creds: HTTPAuthorizationCredentials = Depends(security), conn=Depends(get_db)):
-    token = creds.credentials
-    try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[JWT_ALG])
-        uid = int(payload["sub"])
-    except Exception:
-        raise HTTPException(401, "Invalid or expired token")
-    cur = conn.cursor(dictionary=True)
-    cur.execute("SELECT id, email, name FROM users WHERE id=%s", (uid,))
-    row = cur.fetchone()
-    cur.close()
-    if not row:
-        raise HTTPException(404, "User not found")
-    return MeOut(**row)
+async def me(user: CurrentUser = Depends(current_user)):
+    # Row comes straight from the users table, so skip re-validating it
+    return MeOut.model_construct(id=user.id, email=user.email, name=user.name)
 
 
 @router.get("/profile-picture", responses={
@@ -165,24 +335,12 @@ def me(creds: HTTPAuthorizationCredentials = Depends(security), conn=Depends(get
     401: {"model": HTTPError, "description": "Invalid or expired token"},
     404: {"model": HTTPError, "description": "User not found or no picture set"}
 })
-def get_profile_picture(creds: HTTPAuthorizationCredentials = Depends(security), conn=Depends(get_db)):
+async def get_profile_picture(user: CurrentUser = Depends(current_user)):
     """Return the user's current profile picture URL."""
-    token = creds.credentials
-    try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[JWT_ALG])
-        uid = int(payload["sub"])
-    except Exception:
-        raise HTTPException(401, "Invalid or expired token")
-
-    cur = conn.cursor(dictionary=True)
-    cur.execute("SELECT profile_picture_url FROM users WHERE id=%s", (uid,))
-    row = cur.fetchone()
-    cur.close()
-
-    if not row or not row["profile_picture_url"]:
+    if not user.profile_picture_url:
         raise HTTPException(404, "Profile picture not found")
 
-    return {"profile_picture_url": row["profile_picture_url"]}
+    return {"profile_picture_url": user.profile_picture_url}
 
 
 @router.get("/profile", responses={
@@ -190,28 +348,13 @@ def get_profile_picture(creds: HTTPAuthorizationCredentials = Depends(security),
     401: {"model": HTTPError, "description": "Invalid or expired token"},
     404: {"model": HTTPError, "description": "User not found"}
 })
-def get_full_profile(creds: HTTPAuthorizationCredentials = Depends(security), conn=Depends(get_db)):
+async def get_full_profile(user: CurrentUser = Depends(current_user)):
     """Return combined user info including profile picture."""
-    token = creds.credentials
-    try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[JWT_ALG])
-        uid = int(payload["sub"])
-    except Exception:
-        raise HTTPException(401, "Invalid or expired token")
-
-    cur = conn.cursor(dictionary=True)
-    cur.execute("SELECT id, email, name, profile_picture_url FROM users WHERE id=%s", (uid,))
-    row = cur.fetchone()
-    cur.close()
-
-    if not row:
-        raise HTTPException(404, "User not found")
-
     return {
-        "id": row["id"],
-        "name": row["name"],
-        "email": row["email"],
-        "profile_picture_url": row.get("profile_picture_url")
+        "id": user.id,
+        "name": user.name,
+        "email": user.email,
+        "profile_picture_url": user.profile_picture_url
     }
 
 
@@ -220,10 +363,10 @@ def get_full_profile(creds: HTTPAuthorizationCredentials = Depends(security), co
     400: {"model": HTTPError, "description": "Invalid token or bad input"},
     404: {"model": HTTPError, "description": "User not found"},
 })
-def reset_password(body: ResetPasswordIn, conn=Depends(get_db)):
+async def reset_password(body: ResetPasswordIn, conn=Depends(get_db)):
     """Verify reset token, match email, and update password."""
     try:
-        payload = jwt.decode(body.reset_token, SECRET_KEY, algorithms=[JWT_ALG])
+        payload = decode_token(body.reset_token)
         if payload.get("action") != "password_reset":
             raise HTTPException(400, "Invalid token action")
         uid = int(payload["sub"])
@@ -249,21 +392,12 @@ def reset_password(body: ResetPasswordIn, conn=Depends(get_db)):
         if body.email.lower() != token_email.lower():
             raise HTTPException(400, "Email does not match reset token")
 
-    # --- Verify that user exists ---
-    cur = conn.cursor(dictionary=True)
-    cur.execute("SELECT id, email FROM users WHERE id=%s", (uid,))
-    user = cur.fetchone()
-    if not user:
-        cur.close()
-        raise HTTPException(404, "User not found")
-
     # --- Update password ---
-    cur.execute(
-        "UPDATE users SET password_hash=%s WHERE id=%s",
-        (hash_password(body.new_password), uid)
-    )
-    conn.commit()
-    cur.close()
+    # No existence SELECT: a fresh salt makes every new hash differ from the stored one,
+    # so zero affected rows can only mean the user is gone
+    password_hash = await hash_password_async(body.new_password)
+    if not await run_in_threadpool(update_password_hash, conn, uid, password_hash):
+        raise HTTPException(404, "User not found")
 
     return {"message": "Password reset successful"}
 
@@ -274,25 +408,25 @@ def reset_password(body: ResetPasswordIn, conn=Depends(get_db)):
 })
 def forgot_password(body: ForgotPasswordIn, conn=Depends(get_db)):
     """Generate a short-lived password reset token and email it to the user."""
-    cur = conn.cursor(dictionary=True)
-    cur.execute("SELECT id, email FROM users WHERE email=%s", (body.email,))
-    user = cur.fetchone()
-    cur.close()
+    if not EMAIL_SENDER or not EMAIL_PASSWORD:
+        logger.error("Email credentials not configured properly.")
+        raise HTTPException(500, "Email sending is not configured.")
 
+    user = fetch_one(conn, "SELECT id, email FROM users WHERE email=%s", (body.email,))
     if not user:
         raise HTTPException(404, "User not found")
 
     # Create reset token
-    exp = datetime.now(timezone.utc) + timedelta(minutes=15)
+    exp = int(time.time()) + RESET_TOKEN_EXPIRE_SECONDS
     payload = {"sub": str(user["id"]), "email": user["email"], "exp": exp, "action": "password_reset"}
-    token = jwt.encode(payload, SECRET_KEY, algorithm=JWT_ALG)
+    token = encode_token(payload)
 
     # Build the frontend link
     FRONTEND_URL = os.getenv("FRONTEND_URL", "http://localhost:5173")
     reset_link = f"{FRONTEND_URL}/PasswordReset?token={token}"
 
-    # Send email
-    send_reset_email(user["email"], reset_link)
+    # Queued on the email pool; the SMTP round trips take over a second
+    _EMAIL_POOL.submit(send_reset_email, user["email"], reset_link)
 
     return {"message": "Password reset email sent successfully."}
 
@@ -303,30 +437,25 @@ def forgot_password(body: ForgotPasswordIn, conn=Depends(get_db)):
     401: {"model": HTTPError, "description": "Invalid or expired token"},
 })
 def update_profile_picture(
-    creds: HTTPAuthorizationCredentials = Depends(security),
+    uid: int = Depends(get_uid_from_token),
     file: UploadFile = File(...),
-    conn=Depends(get_db)
 ):
     """Upload a new profile picture to S3 and update the user's URL."""
-    token = creds.credentials
-    try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[JWT_ALG])
-        uid = int(payload["sub"])
-    except Exception:
-        raise HTTPException(401, "Invalid or expired token")
-
     try:
-        key = f"user-{uid}/{file.filename}"
-        s3_client.upload_fileobj(file.file, S3_BUCKET, key)
-        s3_url = f"https://{S3_BUCKET}.s3.{S3_REGION}.amazonaws.com/{key}"
+        # Basename only, restricted to URL-safe characters; the uuid keeps each upload at a new key
+        safe_name = _UNSAFE_KEY_CHARS_RE.sub("_", os.path.basename(file.filename or "upload.bin"))[-128:]
+        key = f"user-{uid}/{uuid.uuid4().hex}-{safe_name}"
+        extra_args = {"ContentType": file.content_type} if file.content_type else None
+        s3_client.upload_fileobj(file.file, S3_BUCKET, key, ExtraArgs=extra_args, Config=_S3_TRANSFER_CONFIG)
+        s3_url = _S3_URL_PREFIX + key
     except (BotoCoreError, ClientError) as e:
         logger.error(f"S3 upload error for user {uid}: {e}")
         raise HTTPException(400, "Failed to upload profile picture")
 
-    cur = conn.cursor()
-    cur.execute("UPDATE users SET profile_picture_url=%s WHERE id=%s", (s3_url, uid))
-    conn.commit()
-    cur.close()
+    # Checked out only now, so a slow upload doesn't hold a pooled connection
+    with db_connection() as conn:
+        set_profile_picture_url(conn, uid, s3_url)
+    _invalidate_user(uid)
 
     return {"message": "Profile picture updated", "profile_picture_url": s3_url}
 
@@ -340,66 +469,134 @@ def update_profile_picture(
 def update_profile(
     name: str = Form(...),
     email: str = Form(...),
-    creds: HTTPAuthorizationCredentials = Depends(security),
+    uid: int = Depends(get_uid_from_token),
     conn=Depends(get_db),
 ):
     """Update user's name and email."""
-    token = creds.credentials
+    # One round trip: the unique key on users.email rejects an address another user already has
+    cur = conn.cursor()
     try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[JWT_ALG])
-        uid = int(payload["sub"])
-    except Exception:
-        raise HTTPException(401, "Invalid or expired token")
-
-    cur = conn.cursor(dictionary=True)
-    cur.execute("SELECT id FROM users WHERE email=%s AND id!=%s", (email, uid))
-    existing = cur.fetchone()
-
-    if existing:
+        cur.execute("UPDATE users SET name=%s, email=%s WHERE id=%s", (name, email, uid))
+    except mysql.connector.errors.IntegrityError as e:
+        if getattr(e, "errno", None) == errorcode.ER_DUP_ENTRY:
+            raise HTTPException(409, "Email already taken")
+        raise
+    finally:
         cur.close()
-        raise HTTPException(409, "Email already taken")
-
-    cur.execute("UPDATE users SET name=%s, email=%s WHERE id=%s", (name, email, uid))
     conn.commit()
-    cur.close()
+    _invalidate_user(uid)
 
     return {"message": "Profile updated successfully", "name": name, "email": email}
 
 
 # --- Authentication Helper Functions ---
 
-def hash_password(raw: str) -> str:
-    return bcrypt.hashpw(raw.encode("utf-8"), bcrypt.gensalt()).decode("utf-8")
+def _b64url_encode(raw: bytes) -> bytes:
+    return base64.urlsafe_b64encode(raw).rstrip(b"=")
+
+
+def _b64url_decode(segment: bytes) -> bytes:
+    return base64.urlsafe_b64decode(segment + b"=" * (-len(segment) % 4))
+
+
+def _sign(signing_input: bytes) -> bytes:
+    mac = _HMAC_SHA256.copy()
+    mac.update(signing_input)
+    return mac.digest()
 
 
-def verify_password(raw: str, hashed: str) -> bool:
+def encode_token(payload: dict) -> str:
+    """Sign payload as a compact HS256 JWT. exp must already be an int timestamp."""
+    signing_input = _JWT_HEADER_B64 + b"." + _b64url_encode(orjson.dumps(payload))
+    sig = _sign(signing_input)
+    return (signing_input + b"." + _b64url_encode(sig)).decode("ascii")
+
+
+def decode_token(token: str) -> dict:
+    """Verify an HS256 JWT and return its payload, raising PyJWT's error types on failure."""
     try:
-        return bcrypt.checkpw(raw.encode("utf-8"), hashed.encode("utf-8"))
-    except Exception:
-        return False
+        signing_input, _, sig_b64 = token.encode("ascii").rpartition(b".")
+        header_b64, _, payload_b64 = signing_input.partition(b".")
+        sig = _b64url_decode(sig_b64)
+    except (UnicodeEncodeError, ValueError, binascii.Error):
+        raise jwt.InvalidTokenError("Malformed token")
+    if header_b64 != _JWT_HEADER_B64 or not payload_b64:
+        raise jwt.InvalidTokenError("Unsupported token header")
+
+    if not hmac.compare_digest(sig, _sign(signing_input)):
+        raise jwt.InvalidSignatureError("Signature verification failed")
+
+    try:
+        payload = orjson.loads(_b64url_decode(payload_b64))
+    except (ValueError, binascii.Error):
+        raise jwt.InvalidTokenError("Malformed token payload")
+    if not isinstance(payload, dict):
+        raise jwt.InvalidTokenError("Malformed token payload")
+
+    exp = payload.get("exp")
+    if exp is not None:
+        if not isinstance(exp, (int, float)):
+            raise jwt.InvalidTokenError("Expiration Time claim (exp) must be an integer")
+        if exp <= time.time():
+            raise jwt.ExpiredSignatureError("Signature has expired")
+    return payload
 
 
 def create_token(user_id: int, email: str) -> TokenOut:
-    exp = datetime.now(timezone.utc) + timedelta(minutes=JWT_EXPIRE_MINUTES)
-    payload = {"sub": str(user_id), "email": email, "exp": exp}
-    token = jwt.encode(payload, SECRET_KEY, algorithm=JWT_ALG)
-    return TokenOut(access_token=token, expires_in=JWT_EXPIRE_MINUTES * 60)
+    token = encode_token({"sub": str(user_id), "email": email, "exp": int(time.time()) + JWT_EXPIRE_SECONDS})
+    return TokenOut.model_construct(access_token=token, expires_in=JWT_EXPIRE_SECONDS)
+
+
+def fetch_one(conn, sql: str, params: tuple) -> dict | None:
+    """Run a single-row SELECT on a buffered dict cursor; the cursor is closed even on error."""
+    cur = conn.cursor(dictionary=True, buffered=True)
+    try:
+        cur.execute(sql, params)
+        return cur.fetchone()
+    finally:
+        cur.close()
+
+
+_USER_BY_EMAIL_SQL = "SELECT id, email, name, password_hash FROM users WHERE email=%s"
+_USER_BY_EMAIL_COLUMNS = ("id", "email", "name", "password_hash")
 
 
 def get_user_by_email(conn, email: str):
-    cur = conn.cursor(dictionary=True)
-    cur.execute("SELECT id, email, name, password_hash FROM users WHERE email=%s", (email,))
-    row = cur.fetchone()
-    cur.close()
-    return row
+    # Plain tuple cursor; the dict is only built when a user actually matches
+    cur = conn.cursor()
+    try:
+        cur.execute(_USER_BY_EMAIL_SQL, (email,))
+        row = cur.fetchone()
+    finally:
+        cur.close()
+    return dict(zip(_USER_BY_EMAIL_COLUMNS, row)) if row else None
+
+
+def update_password_hash(conn, uid: int, password_hash: str) -> bool:
+    cur = conn.cursor()
+    try:
+        cur.execute("UPDATE users SET password_hash=%s WHERE id=%s", (password_hash, uid))
+        conn.commit()
+        return cur.rowcount > 0
+    finally:
+        cur.close()
+
+
+def set_profile_picture_url(conn, uid: int, url: str):
+    cur = conn.cursor()
+    try:
+        cur.execute("UPDATE users SET profile_picture_url=%s WHERE id=%s", (url, uid))
+        conn.commit()
+    finally:
+        cur.close()
 
 
-def create_user(conn, email: str, name: str, password: str):
+def create_user(conn, email: str, name: str, password_hash: str):
     cur = conn.cursor()
     try:
         cur.execute(
             "INSERT INTO users (email, name, password_hash) VALUES (%s,%s,%s)",
-            (email, name, hash_password(password)),
+            (email, name, password_hash),
         )
         user_id = cur.lastrowid
         return user_id
@@ -411,6 +608,9 @@ def create_user(conn, email: str, name: str, password: str):
             getattr(e, "sqlstate", None),
             getattr(e, "msg", str(e)),
         )
-        return None
+        # Only a duplicate email means "already registered"; anything else is a real failure
+        if getattr(e, "errno", None) == errorcode.ER_DUP_ENTRY:
+            return None
+        raise
     finally:
         cur.close()
@@ -1,63 +1,124 @@
 import numpy as np
-from sklearn.cluster import DBSCAN
+import orjson
+import heapq
 from math import ceil
-from fastapi import APIRouter, HTTPException
+from itertools import chain
+from fastapi import APIRouter, HTTPException, Response
 import os
+import time
+import hashlib
+import threading
 import requests
+from requests.adapters import HTTPAdapter
 import concurrent.futures
+from cachetools import TTLCache
 
-from app.models.cluster_models import (
-    ClusterIn,
-    ClusterOut,
-    LocationOut,
-    DayOut,
-    UserPreferenceSolutionOut,
-    OptimalSolutionOut,
-)
+from app.models.cluster_models import ClusterIn, ClusterOut
 from app.models.error_models import HTTPError
 
 # --- Cluster Route ---
 
 GOOGLE_API_KEY = os.getenv("GOOGLE_API_KEY")
+# Shared by every enrichment worker so Google lookups reuse kept-alive TLS connections;
+# sized for a few /cluster or /multicluster requests enriching at once
+HTTP_SESSION = requests.Session()
+HTTP_SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=32))
+# Enrichment workers live for the whole process instead of being spawned per request;
+# sized to match the session's connection pool
+_PLACE_ID_POOL = concurrent.futures.ThreadPoolExecutor(max_workers=32, thread_name_prefix="place-id")
 
 router = APIRouter(prefix="/cluster", tags=["cluster"])
 
 MAX_LOCATIONS_PER_DAY = 9
+CLUSTER_EPS_DEG = 0.0225
+
+# Serialized /cluster responses keyed by a digest of the request payload. Only responses
+# where every location got a place_id are stored; the TTL bounds how long they are reused.
+_CLUSTER_RESPONSE_CACHE: TTLCache = TTLCache(maxsize=256, ttl=3600)
+_CLUSTER_RESPONSE_CACHE_LOCK = threading.Lock()
+
+# Google lookups shared across requests. Coordinates are rounded to 5 decimals (~1 m),
+# well inside the 120 m search radius. Failed lookups are never cached.
+_PLACE_ID_CACHE: TTLCache = TTLCache(maxsize=50000, ttl=86400)
+_LATLNG_CACHE: TTLCache = TTLCache(maxsize=50000, ttl=86400)
+_GOOGLE_CACHE_LOCK = threading.Lock()
 
 
 @router.get("/")
-def test():
+async def test():
     return {"message": "Cluster Endpoint", "success": True}
 
 
 @router.post(
     "/",
-    response_model=ClusterOut,
+    response_model=None,
     responses={
+        200: {"model": ClusterOut, "description": "Successful Response"},
         400: {
             "model": HTTPError,
             "description": "Missing required parameters",
         }
     },
 )
-def get_clusters_given_all_locations(data: ClusterIn) -> ClusterOut:
+def get_clusters_given_all_locations(data: ClusterIn) -> Response:
+    # Serialized once by orjson; skips the ClusterOut rebuild and jsonable_encoder walk
+    key = hashlib.blake2b(orjson.dumps(data.model_dump(), option=orjson.OPT_SORT_KEYS)).digest()
+    with _CLUSTER_RESPONSE_CACHE_LOCK:
+        body = _CLUSTER_RESPONSE_CACHE.get(key)
+    if body is None:
+        solution = build_cluster_solution(data)
+        body = orjson.dumps(solution)
+        # A missing place_id may just be a failed or rate-limited lookup; don't pin it for the TTL
+        if _all_place_ids_resolved(solution):
+            with _CLUSTER_RESPONSE_CACHE_LOCK:
+                _CLUSTER_RESPONSE_CACHE[key] = body
+    return Response(body, media_type="application/json")
+
+
+def build_cluster_solution(data: ClusterIn) -> dict:
+    """Cluster and schedule the locations, returning the ClusterOut shape as plain dicts."""
     # --- Input validation ---
     if not data.locations_sorted:
         raise HTTPException(status_code=400, detail="Missing required fields")
 
+    # Each location needs a place_id or both coordinates; checked before any Google lookup is spent.
+    # The same pass collects the place ids that still need coordinates.
+    unresolved_place_ids: set[str] = set()
+    for loc in data.locations_sorted:
+        if loc.latitude is not None and loc.longitude is not None:
+            continue
+        if not loc.place_id:
+            raise HTTPException(
+                status_code=422,
+                detail="Each location must provide either place_id or both latitude and longitude",
+            )
+        unresolved_place_ids.add(loc.place_id)
+
     # --- Preprocess locations: allow place_id or lat/lng ---
+    # Coordinates, priorities and the stay-hour total are collected in this single pass
+    num_locations = len(data.locations_sorted)
+    # Place ids without coordinates are looked up concurrently before the pass below
+    unresolved_place_ids = list(unresolved_place_ids)
+    resolved_latlngs = dict(
+        zip(unresolved_place_ids, _PLACE_ID_POOL.map(resolve_latlng_from_placeid, unresolved_place_ids))
+    )
     processed_locations: list[dict] = []
-    for loc in data.locations_sorted:
-        if loc.place_id and (loc.latitude is None or loc.longitude is None):
-            latlng = resolve_latlng_from_placeid(loc.place_id)
+    coords = np.empty((num_locations, 2), dtype=np.float64)
+    priorities = np.empty(num_locations, dtype=np.int64)
+    total_stay_hours = 0.0
+    for idx, loc in enumerate(data.locations_sorted):
+        if loc.latitude is not None and loc.longitude is not None:
+            lat, lng = loc.latitude, loc.longitude
+        else:
+            latlng = resolved_latlngs[loc.place_id]
             if not latlng:
                 raise HTTPException(status_code=400, detail=f"Could not resolve place_id {loc.place_id}")
             lat, lng = latlng
-        elif loc.latitude is not None and loc.longitude is not None:
-            lat, lng = loc.latitude, loc.longitude
-        else:
-            raise HTTPException(status_code=400, detail="Each location must have either place_id or lat/lng")
 
+        coords[idx, 0] = lat
+        coords[idx, 1] = lng
+        priorities[idx] = loc.priority
+        total_stay_hours += float(loc.stay_hours)
         processed_locations.append(
             {
                 "latitude": float(lat),
@@ -72,16 +133,17 @@ def get_clusters_given_all_locations(data: ClusterIn) -> ClusterOut:
     max_hours_per_day = max(1, data.max_hours_per_day or 1)
 
     # --- Run clustering ---
-    coords = np.array([(loc["latitude"], loc["longitude"]) for loc in processed_locations])
-    db = DBSCAN(eps=0.0225, min_samples=1).fit(coords)
-    labels = db.labels_
+    labels = cluster_labels(coords)
 
     for loc, label in zip(processed_locations, labels):
         loc["cluster_id"] = int(label)
 
     # --- Group into clusters ---
-    clusters_dict = {}
-    for loc in processed_locations:
+    # Walk locations in stable priority order so each cluster's list comes out
+    # already sorted by priority (ties keep input order).
+    clusters_dict: dict[int, list[dict]] = {}
+    for idx in np.argsort(priorities, kind="stable").tolist():
+        loc = processed_locations[idx]
         clusters_dict.setdefault(loc["cluster_id"], []).append(loc)
 
     # --- User Preference Solution (follow input order within requested days) ---
@@ -105,9 +167,8 @@ def get_clusters_given_all_locations(data: ClusterIn) -> ClusterOut:
         day_hours[current_day_idx] += loc["stay_hours"]
 
     # --- Optimal Solution (split by clusters across days/min days) ---
-    total_stay_hours = sum(loc["stay_hours"] for loc in processed_locations)
     min_days_by_hours = ceil(total_stay_hours / max_hours_per_day)
-    min_days_by_locations = ceil(len(processed_locations) / MAX_LOCATIONS_PER_DAY)
+    min_days_by_locations = ceil(num_locations / MAX_LOCATIONS_PER_DAY)
     min_days_needed = max(min_days_by_hours, min_days_by_locations)
     num_days = max(1, min_days_needed)
 
@@ -115,102 +176,83 @@ def get_clusters_given_all_locations(data: ClusterIn) -> ClusterOut:
     day_bucket_hours = [0.0 for _ in range(num_days)]
     overflow_locations: list[dict] = []
 
+    # Days ordered by most hours left, then most slots left, then earliest; keys are
+    # negated for heapq's min-heap. Every day has exactly one entry.
+    day_heap = [(-float(max_hours_per_day), -MAX_LOCATIONS_PER_DAY, idx) for idx in range(num_days)]
+
+    def take_day(slots: int, hours: float) -> int | None:
+        """Pop the best day that still fits `slots` locations and `hours`; days passed over go back."""
+        skipped = []
+        found = None
+        while day_heap:
+            entry = heapq.heappop(day_heap)
+            idx = entry[2]
+            if (
+                len(day_buckets[idx]) + slots <= MAX_LOCATIONS_PER_DAY
+                and day_bucket_hours[idx] + hours <= max_hours_per_day + 1e-6
+            ):
+                found = idx
+                break
+            skipped.append(entry)
+        for entry in skipped:
+            heapq.heappush(day_heap, entry)
+        return found
+
+    def add_to_day(idx: int, locs: list[dict], hours: float) -> None:
+        day_buckets[idx].extend(locs)
+        day_bucket_hours[idx] += hours
+        heapq.heappush(
+            day_heap,
+            (-(max_hours_per_day - day_bucket_hours[idx]), -(MAX_LOCATIONS_PER_DAY - len(day_buckets[idx])), idx),
+        )
+
+    # Cluster ids are numbered by first appearance, so they break min-priority ties in input order
     cluster_order = sorted(
         clusters_dict.items(),
-        key=lambda item: min(loc["priority"] for loc in item[1]),
+        key=lambda item: (item[1][0]["priority"], item[0]),
     )
 
-    for _, cluster_locs in cluster_order:
-        cluster_sorted = sorted(cluster_locs, key=lambda loc: loc["priority"])
+    for _, cluster_sorted in cluster_order:
         cluster_hours = sum(loc["stay_hours"] for loc in cluster_sorted)
-        candidate_days = [
-            idx
-            for idx in range(num_days)
-            if len(day_buckets[idx]) + len(cluster_sorted) <= MAX_LOCATIONS_PER_DAY
-            and day_bucket_hours[idx] + cluster_hours <= max_hours_per_day + 1e-6
-        ]
-
-        if candidate_days:
-            best_day = max(
-                candidate_days,
-                key=lambda idx: (
-                    max_hours_per_day - day_bucket_hours[idx],
-                    MAX_LOCATIONS_PER_DAY - len(day_buckets[idx]),
-                ),
-            )
-            day_buckets[best_day].extend(cluster_sorted)
-            day_bucket_hours[best_day] += cluster_hours
+        day_idx = take_day(len(cluster_sorted), cluster_hours)
+        if day_idx is not None:
+            add_to_day(day_idx, cluster_sorted, cluster_hours)
             continue
 
+        # Cluster doesn't fit whole on any day; place its locations one at a time
         for loc in cluster_sorted:
-            day_indices = sorted(
-                [
-                    idx
-                    for idx in range(num_days)
-                    if len(day_buckets[idx]) < MAX_LOCATIONS_PER_DAY
-                ],
-                key=lambda idx: (
-                    max_hours_per_day - day_bucket_hours[idx],
-                    MAX_LOCATIONS_PER_DAY - len(day_buckets[idx]),
-                ),
-                reverse=True,
-            )
-            placed = False
-            for day_idx in day_indices:
-                if (
-                    day_bucket_hours[day_idx] + loc["stay_hours"] <= max_hours_per_day + 1e-6
-                    and len(day_buckets[day_idx]) < MAX_LOCATIONS_PER_DAY
-                ):
-                    day_buckets[day_idx].append(loc)
-                    day_bucket_hours[day_idx] += loc["stay_hours"]
-                    placed = True
-                    break
-            if not placed:
+            day_idx = take_day(1, loc["stay_hours"])
+            if day_idx is None:
                 overflow_locations.append(loc)
-
-    # --- Build response using Pydantic models ---
-    def make_location_out(loc: dict) -> LocationOut:
-        return LocationOut(
-            latitude=float(loc["latitude"]),
-            longitude=float(loc["longitude"]),
-            priority=int(loc["priority"]),
-            stay_hours=float(loc["stay_hours"]),
-            cluster_id=int(loc["cluster_id"]),
-            place_id=loc.get("place_id"),
-        )
+            else:
+                add_to_day(day_idx, [loc], loc["stay_hours"])
+
+    # --- Build response as plain dicts in the ClusterOut shape ---
+    def make_location_out(loc: dict) -> dict:
+        return {
+            "latitude": float(loc["latitude"]),
+            "longitude": float(loc["longitude"]),
+            "priority": int(loc["priority"]),
+            "stay_hours": float(loc["stay_hours"]),
+            "cluster_id": int(loc["cluster_id"]),
+            "place_id": loc.get("place_id"),
+        }
 
     user_pref_days = [
-        DayOut(
-            day=day_idx + 1,
-            locations=[make_location_out(loc) for loc in day_locs],
-        )
+        {"day": day_idx + 1, "locations": [make_location_out(loc) for loc in day_locs]}
         for day_idx, day_locs in enumerate(day_slots)
     ]
 
     optimal_days = [
-        DayOut(
-            day=day_idx + 1,
-            locations=[make_location_out(loc) for loc in day_locs],
-        )
+        {"day": day_idx + 1, "locations": [make_location_out(loc) for loc in day_locs]}
         for day_idx, day_locs in enumerate(day_buckets)
         if day_locs
     ]
 
-    overflow_signatures = set()
-    for loc in overflow_locations:
-        key = (
-            round(loc["latitude"], 6),
-            round(loc["longitude"], 6),
-            loc.get("place_id"),
-            loc["priority"],
-        )
-        if key not in overflow_signatures:
-            solution1_rejected.append(loc)
-            overflow_signatures.add(key)
-
+    # Overflowed locations join the rejected list, each signature only once
     rejected_unique: list[dict] = []
     rejected_seen = set()
-    for loc in solution1_rejected:
+    for loc in chain(solution1_rejected, overflow_locations):
         key = (
             round(loc["latitude"], 6),
             round(loc["longitude"], 6),
@@ -222,49 +264,94 @@ def get_clusters_given_all_locations(data: ClusterIn) -> ClusterOut:
         rejected_seen.add(key)
         rejected_unique.append(loc)
 
-    response = ClusterOut(
-        user_preference_solution=UserPreferenceSolutionOut(
-            days=user_pref_days,
-            rejected=[make_location_out(loc) for loc in rejected_unique],
-        ),
-        optimal_solution=OptimalSolutionOut(
-            days=optimal_days,
-        ),
-    )
+    response = {
+        "user_preference_solution": {
+            "days": user_pref_days,
+            "rejected": [make_location_out(loc) for loc in rejected_unique],
+        },
+        "optimal_solution": {
+            "days": optimal_days,
+        },
+    }
 
     # --- Enrich with place_ids (concurrent) ---
-    enriched = add_place_ids_to_clusters(response.dict())
-    return ClusterOut(**enriched)
+    return add_place_ids_to_clusters(response)
 
 
 # ---------------- Helper Functions ----------------
 
-def _enrich_loc_with_place_id(loc: dict) -> dict:
-    """Enrich location dict with place_id and corrected lat/lng."""
-    lat = float(loc["latitude"])
-    lng = float(loc["longitude"])
-    if loc.get("place_id"):
-        loc["latitude"] = lat
-        loc["longitude"] = lng
-        return loc
-    result = resolve_place_id(lat, lng)
+def cluster_labels(coords: np.ndarray, eps: float = CLUSTER_EPS_DEG) -> list[int]:
+    """
+    Single-linkage clustering of (lat, lng) rows at radius eps, i.e. the same labels
+    DBSCAN(eps, min_samples=1) gives. Points are bucketed into eps-sized grid cells,
+    so each point is only compared against the 3x3 block of cells around it.
+    """
+    points = coords.tolist()
+    parent = list(range(len(points)))
+
+    def find(i: int) -> int:
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    # Grid cells for every point in one vectorized pass
+    cells = np.floor(coords / eps).astype(np.int64).tolist()
+
+    eps_sq = eps * eps
+    grid: dict[tuple[int, int], list[int]] = {}
+    for i, (lat, lng) in enumerate(points):
+        cx, cy = cells[i]
+        for dx in (-1, 0, 1):
+            for dy in (-1, 0, 1):
+                for j in grid.get((cx + dx, cy + dy), ()):
+                    if (points[j][0] - lat) ** 2 + (points[j][1] - lng) ** 2 <= eps_sq:
+                        root_i, root_j = find(i), find(j)
+                        if root_i != root_j:
+                            parent[root_i] = root_j
+        grid.setdefault((cx, cy), []).append(i)
+
+    # Number clusters in order of first appearance, as DBSCAN does
+    root_labels: dict[int, int] = {}
+    return [root_labels.setdefault(find(i), len(root_labels)) for i in range(len(points))]
+
+
+def _all_place_ids_resolved(clusters_response: dict) -> bool:
+    user_pref = clusters_response["user_preference_solution"]
+    locations = chain(
+        chain.from_iterable(day["locations"] for day in user_pref["days"]),
+        user_pref["rejected"],
+        chain.from_iterable(day["locations"] for day in clusters_response["optimal_solution"]["days"]),
+    )
+    return all(loc.get("place_id") for loc in locations)
 
-    if result:
-        pid, new_lat, new_lng = result
-        loc["place_id"] = pid
-        loc["latitude"] = float(new_lat)
-        loc["longitude"] = float(new_lng)
-    else:
-        loc["place_id"] = None
-        loc["latitude"] = float(lat)
-        loc["longitude"] = float(lng)
 
-    return loc
+def _enrich_locs_with_place_id(locs: list[dict]) -> list[dict]:
+    """Resolve place_id and corrected lat/lng for locations sharing one coordinate. Updates the dicts in place."""
+    lat = float(locs[0]["latitude"])
+    lng = float(locs[0]["longitude"])
+    result = resolve_place_id(lat, lng)
+
+    for loc in locs:
+        if result:
+            pid, new_lat, new_lng = result
+            loc["place_id"] = pid
+            loc["latitude"] = float(new_lat)
+            loc["longitude"] = float(new_lng)
+        else:
+            loc["place_id"] = None
+            loc["latitude"] = lat
+            loc["longitude"] = lng
 
+    return locs
 
 
-def add_place_ids_to_clusters(clusters_response: dict, max_workers: int = 12) -> dict:
-    """Walk the response shape and add place_id to every location. Done concurrently."""
+def add_place_ids_to_clusters(clusters_response: dict) -> dict:
+    """
+    Walk the response shape and add place_id to every location, in place; the same
+    response object is returned. All lookups are submitted before any result is
+    awaited, so they run concurrently; results are only collected to log failures.
+    """
     targets: list[dict] = []
 
     user_pref = clusters_response.get("user_preference_solution", {})
@@ -278,19 +365,46 @@ def add_place_ids_to_clusters(clusters_response: dict, max_workers: int = 12) ->
         for loc in day.get("locations", []):
             targets.append(loc)
 
-    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as ex:
-        futures = [ex.submit(_enrich_loc_with_place_id, loc) for loc in targets]
-        for f in concurrent.futures.as_completed(futures):
-            try:
-                f.result()
-            except Exception as e:
-                print(f"[PlaceID Enrich Error] {e}")
+    # Every location appears in both solutions, so group by coordinate and look each one up
+    # once; concurrent duplicates would otherwise all miss the lookup cache together
+    pending: dict[tuple[float, float], list[dict]] = {}
+    for loc in targets:
+        if not loc.get("place_id"):
+            pending.setdefault((float(loc["latitude"]), float(loc["longitude"])), []).append(loc)
+
+    futures = [_PLACE_ID_POOL.submit(_enrich_locs_with_place_id, locs) for locs in pending.values()]
+    for f in concurrent.futures.as_completed(futures):
+        try:
+            f.result()
+        except Exception as e:
+            print(f"[PlaceID Enrich Error] {e}")
 
     return clusters_response
 
 
 # ---------------- Google API Helpers ----------------
 
+GOOGLE_RATE_LIMIT_RETRIES = 3
+
+
+class GoogleRateLimited(Exception):
+    """Google still reported the rate limit after every retry."""
+
+
+def _google_get_json(url: str, params: dict, timeout: float) -> dict:
+    """GET a Google Maps endpoint, backing off 0.5s, 1s, 2s while it reports the rate limit."""
+    for attempt in range(GOOGLE_RATE_LIMIT_RETRIES + 1):
+        resp = HTTP_SESSION.get(url, params=params, timeout=timeout)
+        if resp.status_code != 429:
+            data = resp.json()
+            if data.get("status") != "OVER_QUERY_LIMIT":
+                return data
+        if attempt < GOOGLE_RATE_LIMIT_RETRIES:
+            # Only ever runs on enrichment worker threads, never on the event loop
+            time.sleep(0.5 * 2 ** attempt)
+    raise GoogleRateLimited(url)
+
+
 def _google_places_nearby_place_id(lat: float, lng: float, keyword: str | None = None, radius: int = 120, timeout: float = 5.0) -> tuple[str, float, float] | None:
     if not GOOGLE_API_KEY:
         return None
@@ -304,13 +418,14 @@ def _google_places_nearby_place_id(lat: float, lng: float, keyword: str | None =
         params["keyword"] = keyword
 
     try:
-        resp = requests.get("https://maps.googleapis.com/maps/api/place/nearbysearch/json", params=params, timeout=timeout)
-        data = resp.json()
+        data = _google_get_json("https://maps.googleapis.com/maps/api/place/nearbysearch/json", params, timeout)
         if data.get("status") == "OK" and data.get("results"):
             top = data["results"][0]
             pid = top.get("place_id")
             loc = top.get("geometry", {}).get("location", {})
             return pid, loc.get("lat", lat), loc.get("lng", lng)
+    except GoogleRateLimited:
+        raise
     except Exception as e:
         print(f"[Google Places Nearby Error] {e}")
     return None
@@ -320,13 +435,14 @@ def _google_reverse_geocode_place_id(lat: float, lng: float, timeout: float = 5.
     if not GOOGLE_API_KEY:
         return None
     try:
-        resp = requests.get("https://maps.googleapis.com/maps/api/geocode/json", params={"latlng": f"{lat},{lng}", "key": GOOGLE_API_KEY}, timeout=timeout)
-        data = resp.json()
+        data = _google_get_json("https://maps.googleapis.com/maps/api/geocode/json", {"latlng": f"{lat},{lng}", "key": GOOGLE_API_KEY}, timeout)
         if data.get("status") == "OK" and data.get("results"):
             top = data["results"][0]
             pid = top.get("place_id")
             loc = top.get("geometry", {}).get("location", {})
             return pid, loc.get("lat", lat), loc.get("lng", lng)
+    except GoogleRateLimited:
+        raise
     except Exception as e:
         print(f"[Google Reverse Geocode Error] {e}")
     return None
@@ -335,19 +451,38 @@ def _google_reverse_geocode_place_id(lat: float, lng: float, timeout: float = 5.
 def resolve_latlng_from_placeid(place_id: str, timeout: float = 5.0) -> tuple[float, float] | None:
     if not GOOGLE_API_KEY:
         return None
+    with _GOOGLE_CACHE_LOCK:
+        cached = _LATLNG_CACHE.get(place_id)
+    if cached is not None:
+        return cached
     try:
-        resp = requests.get("https://maps.googleapis.com/maps/api/place/details/json", params={"place_id": place_id, "fields": "geometry", "key": GOOGLE_API_KEY}, timeout=timeout)
-        data = resp.json()
+        data = _google_get_json("https://maps.googleapis.com/maps/api/place/details/json", {"place_id": place_id, "fields": "geometry", "key": GOOGLE_API_KEY}, timeout)
         if data.get("status") == "OK" and "result" in data:
             loc = data["result"]["geometry"]["location"]
-            return loc["lat"], loc["lng"]
+            latlng = loc["lat"], loc["lng"]
+            with _GOOGLE_CACHE_LOCK:
+                _LATLNG_CACHE[place_id] = latlng
+            return latlng
     except Exception as e:
         print(f"[Resolve PlaceID Error] {e}")
     return None
 
 
 def resolve_place_id(lat: float, lng: float, keyword: str | None = None) -> tuple[str, float, float] | None:
-    result = _google_places_nearby_place_id(lat, lng, keyword=keyword)
+    lat, lng = round(lat, 5), round(lng, 5)
+    key = (lat, lng, keyword)
+    with _GOOGLE_CACHE_LOCK:
+        cached = _PLACE_ID_CACHE.get(key)
+    if cached is not None:
+        return cached
+
+    try:
+        result = _google_places_nearby_place_id(lat, lng, keyword=keyword) or _google_reverse_geocode_place_id(lat, lng)
+    except GoogleRateLimited as e:
+        # Geocoding shares the quota, so falling back would only sit through a second backoff
+        print(f"[Google Rate Limited] {e}")
+        return None
     if result:
-        return result
-    return _google_reverse_geocode_place_id(lat, lng)
+        with _GOOGLE_CACHE_LOCK:
+            _PLACE_ID_CACHE[key] = result
+    return result
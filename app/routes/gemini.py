@@ -1,11 +1,15 @@
 import os
 import re
-import json
+import copy
 import math
+import threading
 import concurrent.futures
 from typing import Dict, Optional, List, Any, Set
 
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from cachetools import TTLCache
 from fastapi import APIRouter, HTTPException
 from google import genai
 
@@ -482,14 +486,20 @@ API_KEYS = [k for k in API_KEYS if k]
 if not API_KEYS:
     raise RuntimeError("No Gemini API keys found in .env")
 
+# One client per key, built at import so requests reuse their HTTP sessions
+# instead of constructing a fresh client (and connection) on every call.
+GEMINI_CLIENTS = [genai.Client(api_key=k) for k in API_KEYS]
+
 _current_key_index = -1
+_key_index_lock = threading.Lock()
 
 def get_next_client():
     global _current_key_index
-    _current_key_index = (_current_key_index + 1) % len(API_KEYS)
-    api_key = API_KEYS[_current_key_index]
-    print(f"[Gemini] Using API key index: {_current_key_index}")
-    return genai.Client(api_key=api_key)
+    with _key_index_lock:
+        _current_key_index = (_current_key_index + 1) % len(GEMINI_CLIENTS)
+        key_index = _current_key_index
+    print(f"[Gemini] Using API key index: {key_index}")
+    return GEMINI_CLIENTS[key_index]
 
 
 def normalize_location_key(name: Optional[str], city: Optional[str], address: Optional[str]) -> str:
@@ -656,6 +666,12 @@ def haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
 
 
 
+# --- Shared HTTP session (Google Geocoding / Unsplash) ---
+# Reused across requests and geocoding worker threads so TLS connections are kept alive
+GOOGLE_API_KEY = os.getenv("GOOGLE_API_KEY")
+HTTP_SESSION = requests.Session()
+HTTP_SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
+
 # --- Unsplash API (Free Photos) ---
 UNSPLASH_KEY = os.getenv("UNSPLASH_ACCESS_KEY")
 if not UNSPLASH_KEY:
@@ -682,7 +698,7 @@ def resolve_place_photo(
         query = ", ".join(component for component in components if component)
 
         url = "https://api.unsplash.com/search/photos"
-        resp = requests.get(
+        resp = HTTP_SESSION.get(
             url,
             params={
                 "query": query,
@@ -706,7 +722,7 @@ def resolve_place_photo(
 router = APIRouter(prefix="/llm", tags=["Gemini LLM"])
 
 @router.get("/")
-def test():
+async def test():
     return {"message": "Gemini LLM Endpoint", "success": True}
 
 
@@ -1090,9 +1106,7 @@ def generate_itinerary(
     ) -> tuple[Dict[str, list], Dict[str, int], Dict[str, int], Dict[str, Dict[str, int]]]:
         try:
             print(f"[Gemini] Attempt {attempt}: requesting itinerary for {', '.join(cleaned_cities)}")
-            response = call_gemini_once(prompt)
-            llm_text = getattr(response, "text", str(response))
-            llm_data = safe_parse_llm_output(llm_text)
+            llm_data = generate_llm_data(prompt)
         except Exception as e:
             raise HTTPException(status_code=503, detail=f"Gemini call failed or invalid JSON: {e}")
 
@@ -1418,6 +1432,30 @@ def generate_itinerary(
 
 
 # --- Gemini utilities ---
+
+# Prompts are fully determined by the city, preferences and retry state, so repeated
+# requests can reuse the parsed LLM output instead of paying for another Gemini round trip.
+# Only output with the shape the planner needs (a dict with "categories") is cached; each
+# hit is a deep copy so callers can mutate it freely.
+_LLM_RESPONSE_CACHE: TTLCache = TTLCache(maxsize=64, ttl=3600)
+_LLM_RESPONSE_CACHE_LOCK = threading.Lock()
+
+
+def generate_llm_data(prompt: str) -> Any:
+    with _LLM_RESPONSE_CACHE_LOCK:
+        cached = _LLM_RESPONSE_CACHE.get(prompt)
+    if cached is not None:
+        print("[Gemini] Using cached response for identical prompt")
+        return copy.deepcopy(cached)
+
+    response = call_gemini_once(prompt)
+    llm_text = getattr(response, "text", str(response))
+    llm_data = safe_parse_llm_output(llm_text)
+    if isinstance(llm_data, dict) and "categories" in llm_data:
+        with _LLM_RESPONSE_CACHE_LOCK:
+            _LLM_RESPONSE_CACHE[prompt] = copy.deepcopy(llm_data)
+    return llm_data
+
 def call_gemini_once(prompt: str, model: str = "gemini-2.5-flash-lite", timeout: int = 50):
     client = get_next_client()
 
@@ -1459,6 +1497,10 @@ def call_gemini_once(prompt: str, model: str = "gemini-2.5-flash-lite", timeout:
     except Exception as e:
         raise HTTPException(status_code=503, detail=f"Gemini error: {e}")
 
+_CODE_FENCE_RE = re.compile(r"```(?:json|JSON)?\s*(.*?)```", flags=re.DOTALL)
+_TRAILING_COMMA_RE = re.compile(r",\s*([}\]])")
+
+
 def safe_parse_llm_output(llm_text: str):
     if not isinstance(llm_text, str):
         llm_text = str(llm_text)
@@ -1467,7 +1509,7 @@ def safe_parse_llm_output(llm_text: str):
     def _remove_code_fences(src: str) -> str:
         if "```" not in src:
             return src
-        matches = re.findall(r"```(?:json|JSON)?\s*(.*?)```", src, flags=re.DOTALL)
+        matches = _CODE_FENCE_RE.findall(src)
         if matches:
             return matches[0].strip()
         return src.replace("```", "")
@@ -1506,9 +1548,9 @@ def safe_parse_llm_output(llm_text: str):
         return candidates
 
     def _try_parse(src: str) -> Any:
-        for candidate in (src, re.sub(r",\s*([}\]])", r"\1", src)):
+        for candidate in (src, _TRAILING_COMMA_RE.sub(r"\1", src)):
             try:
-                return json.loads(candidate)
+                return orjson.loads(candidate)
             except Exception:
                 continue
         return None
@@ -1549,7 +1591,6 @@ def resolve_latlng_from_address(
     """
     Resolve an address string into latitude/longitude using Google Geocoding API.
     """
-    GOOGLE_API_KEY = os.getenv("GOOGLE_API_KEY")
     if not GOOGLE_API_KEY or not address:
         return None
     query_parts = [address]
@@ -1557,7 +1598,7 @@ def resolve_latlng_from_address(
         query_parts.append(city)
     query = ", ".join(part for part in query_parts if part)
     try:
-        resp = requests.get(
+        resp = HTTP_SESSION.get(
             "https://maps.googleapis.com/maps/api/geocode/json",
             params={"address": query, "key": GOOGLE_API_KEY},
             timeout=timeout,
@@ -1,42 +1,53 @@
-from fastapi import APIRouter, HTTPException
+import orjson
+import concurrent.futures
+from fastapi import APIRouter, HTTPException, Response
 
-from app.models.multicluster_models import MultiClusterIn, MultiClusterOut, CityClusterOut
+from app.models.multicluster_models import MultiClusterIn, MultiClusterOut
 from app.models.error_models import HTTPError
-from app.routes.cluster import get_clusters_given_all_locations
+from app.routes.cluster import build_cluster_solution
 
 router = APIRouter(prefix="/multicluster", tags=["multicluster"])
 
+# City solves are I/O-bound on Google lookups, so this caps threads per request, not cores
+MAX_CITY_WORKERS = 8
+
 
 @router.get("/")
-def test():
+async def test():
     return {"message": "Multi-cluster Endpoint", "success": True}
 
 
 @router.post(
     "/",
-    response_model=MultiClusterOut,
+    response_model=None,
     responses={
+        200: {"model": MultiClusterOut, "description": "Successful Response"},
         400: {
             "description": "Missing required parameters",
             "model": HTTPError,
         }
     },
 )
-def get_multicity_clusters(data: MultiClusterIn) -> MultiClusterOut:
+def get_multicity_clusters(data: MultiClusterIn) -> Response:
     if not data.cities:
         raise HTTPException(status_code=400, detail="At least one city must be provided")
 
-    city_solutions: list[CityClusterOut] = []
-
-    for city_request in data.cities:
-        try:
-            city_cluster = get_clusters_given_all_locations(city_request)
-        except HTTPException as exc:
-            detail = exc.detail if isinstance(exc.detail, str) else str(exc.detail)
-            raise HTTPException(
-                status_code=exc.status_code,
-                detail=f"City '{city_request.city}': {detail}",
-            )
-        city_solutions.append(CityClusterOut(city=city_request.city, solution=city_cluster))
-
-    return MultiClusterOut(cities=city_solutions)
+    # Cities are independent and mostly wait on Google lookups, so solve them side by side.
+    # Results are consumed in request order so the first failing city is the one reported.
+    city_solutions: list[dict] = []
+    max_workers = min(len(data.cities), MAX_CITY_WORKERS)
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as ex:
+        futures = [ex.submit(build_cluster_solution, city_request) for city_request in data.cities]
+        for city_request, future in zip(data.cities, futures):
+            try:
+                city_cluster = future.result()
+            except HTTPException as exc:
+                detail = exc.detail if isinstance(exc.detail, str) else str(exc.detail)
+                raise HTTPException(
+                    status_code=exc.status_code,
+                    detail=f"City '{city_request.city}': {detail}",
+                )
+            city_solutions.append({"city": city_request.city, "solution": city_cluster})
+
+    return Response(orjson.dumps({"cities": city_solutions}), media_type="application/json")
@@ -1,6 +1,7 @@
 from ortools.constraint_solver import pywrapcp, routing_enums_pb2
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Response
 import requests
+import orjson
 import os
 
 from app.models.trip_opti_models import TripOptiIn, TripOptiOut
@@ -14,7 +15,7 @@ router = APIRouter(prefix="/trip_optimizer", tags=["trip_optimizer"])
 GOOGLE_API_KEY = os.getenv("GOOGLE_API_KEY","change-this") 
 
 @router.get("/")
-def test():
+async def test():
     return {"message": "Trip Optimizer Endpoint", "success": True}
 
 @router.post("/", responses={
@@ -107,11 +108,11 @@ def get_optimized_route(request: TripOptiIn):
     data['dinner_end_hour'] = dinner_end_hour
 
     result = trip_optimizer(data=data, lunch_index=lunch_index, dinner_index=dinner_index)
-    return {"route": result}
+    # Route items are plain str/int dicts, so orjson can write them without jsonable_encoder
+    return Response(orjson.dumps({"route": result}), media_type="application/json")
 
 # --- Trip optimizer algorithm ---
 def trip_optimizer(data: dict, lunch_index: int = 0, dinner_index: int = 0, flip: bool = False):
-    print(data)
 
     # Check for lunch/dinner
     if (lunch_index != -1):
@@ -0,0 +1,73 @@
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# --- Wildcard CORS ---
+# Same responses as CORSMiddleware(allow_origins=["*"], allow_methods=["*"], allow_headers=["*"]),
+# but every header is prebuilt so a request only costs a header scan and a list append.
+
+_ALLOW_ORIGIN = (b"access-control-allow-origin", b"*")
+_VARY = (
+    b"vary",
+    b"Origin, Access-Control-Request-Method, Access-Control-Request-Headers, "
+    b"Access-Control-Request-Private-Network",
+)
+_PREFLIGHT_HEADERS = [
+    _VARY,
+    _ALLOW_ORIGIN,
+    (b"access-control-allow-methods", b"DELETE, GET, HEAD, OPTIONS, PATCH, POST, PUT"),
+    (b"access-control-max-age", b"600"),
+    (b"content-type", b"text/plain; charset=utf-8"),
+]
+
+
+class WildcardCORSMiddleware:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        has_origin = False
+        request_method = requested_headers = private_network = None
+        for name, value in scope["headers"]:
+            if name == b"origin":
+                has_origin = True
+            elif name == b"access-control-request-method":
+                request_method = value
+            elif name == b"access-control-request-headers":
+                requested_headers = value
+            elif name == b"access-control-request-private-network":
+                private_network = value
+
+        if not has_origin:
+            await self.app(scope, receive, send)
+            return
+
+        if scope["method"] == "OPTIONS" and request_method is not None:
+            await self._preflight(send, requested_headers, private_network is not None)
+            return
+
+        async def send_with_cors(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                # New list, like CORSMiddleware: the one passed in may be a reused Response's raw_headers
+                headers = [h for h in message.get("headers", ()) if h[0] != _ALLOW_ORIGIN[0]]
+                headers.append(_ALLOW_ORIGIN)
+                message["headers"] = headers
+            await send(message)
+
+        await self.app(scope, receive, send_with_cors)
+
+    @staticmethod
+    async def _preflight(send: Send, requested_headers: bytes | None, private_network: bool) -> None:
+        headers = list(_PREFLIGHT_HEADERS)
+        # allow_headers="*" mirrors back whatever the browser asked for
+        if requested_headers is not None:
+            headers.append((b"access-control-allow-headers", requested_headers))
+        if private_network:
+            status, body = 400, b"Disallowed CORS private-network"
+        else:
+            status, body = 200, b"OK"
+        headers.append((b"content-length", str(len(body)).encode()))
+        await send({"type": "http.response.start", "status": status, "headers": headers})
+        await send({"type": "http.response.body", "body": body})